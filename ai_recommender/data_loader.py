@@ -1,20 +1,213 @@
+import numpy as np
 import pandas as pd
-from scipy.sparse import csr_matrix
+from scipy.sparse import coo_matrix, csr_matrix
 import os
 
-def load_data(file_path):
+RATING_COLUMNS = ['userId', 'movieId', 'rating']
+
+# MovieLens ratings are on a 0.5-5.0 scale; anything outside is dropped
+MIN_RATING = 0.5
+MAX_RATING = 5.0
+
+# Rows parsed per chunk when streaming a ratings file
+DEFAULT_CHUNKSIZE = 1_000_000
+
+# Bytes kept per accepted rating between chunks: int32 userId + int32 movieId + float32 rating
+BYTES_PER_RATING = 12
+
+# Extra bytes per rating while building the matrix: int32 row/column indices and
+# float64 values (16), then the CSR int32 indices and float64 data (12)
+BUILD_BYTES_PER_RATING = 28
+
+def load_data(file_path, chunksize=DEFAULT_CHUNKSIZE):
     """"
     Load the MovieLens ratings data from a CSV file.
+
+    The file is read in chunks of `chunksize` rows and stored with int32 ids,
+    so the parser never holds more than one chunk of raw rows at a time.
+    Ratings are returned as float64 so models built from them keep full precision.
     """
     try:
         # Load the ratings data from the provided path
-        # Read the CSV file into a pandas DataFrame
-        ratings_df = pd.read_csv(file_path, usecols=['userId', 'movieId', 'rating'])
+        # Read the CSV file chunk by chunk into a single pandas DataFrame
+        chunks = list(iter_rating_chunks(file_path, chunksize=chunksize))
+        if chunks:
+            ratings_df = pd.concat(chunks, ignore_index=True)
+        else:
+            ratings_df = _empty_ratings()
+        ratings_df['rating'] = ratings_df['rating'].astype(np.float64)
         print(f"Data loaded successfully from {os.path.abspath(file_path)}. Total ratings: {len(ratings_df)}")
         return ratings_df
     except FileNotFoundError:
         print(f"Error: The file at {file_path} was not found.")
         return None
+
+def clean_ratings(chunk):
+    """
+    Drop incomplete rows and ratings outside the 0.5-5.0 scale, and cast the
+    ratings columns to compact dtypes.
+    """
+    chunk = chunk.dropna(subset=RATING_COLUMNS)
+    chunk = chunk.astype({'userId': np.int32, 'movieId': np.int32, 'rating': np.float32})
+    return chunk[(chunk['rating'] >= MIN_RATING) & (chunk['rating'] <= MAX_RATING)]
+
+def iter_rating_chunks(file_path, chunksize=DEFAULT_CHUNKSIZE, usecols=RATING_COLUMNS):
+    """
+    Yield cleaned ratings DataFrames of at most `chunksize` rows each.
+    """
+    reader = pd.read_csv(file_path, usecols=usecols, chunksize=chunksize)
+    with reader:
+        for chunk in reader:
+            yield clean_ratings(chunk)
+
+def _empty_ratings():
+    return pd.DataFrame({
+        'userId': pd.Series(dtype=np.int32),
+        'movieId': pd.Series(dtype=np.int32),
+        'rating': pd.Series(dtype=np.float32),
+    })
+
+class RatingsAccumulator:
+    """
+    Incrementally collect ratings chunks into popularity stats and sparse
+    matrix triplets.
+
+    Memory guarantee: between chunks only BYTES_PER_RATING bytes per accepted
+    rating are retained, plus O(num_movies + num_users) for the stats and id
+    sets. The raw chunk itself is never kept, so the working set of a single
+    `add` call is bounded by `chunksize`. Building the matrix adds at most
+    another BUILD_BYTES_PER_RATING bytes per rating for the row/column indices
+    and the CSR copy, which holds float64 values like `create_user_item_matrix`.
+
+    With `keep_triplets=False` only the popularity stats are collected and no
+    per-rating memory is retained at all.
+    """
+
+    def __init__(self, keep_triplets=True):
+        self.keep_triplets = keep_triplets
+        self._user_ids = []
+        self._movie_ids = []
+        self._ratings = []
+        self._rating_count = pd.Series(dtype=np.int64)
+        self._rating_sum = pd.Series(dtype=np.float64)
+        self.num_ratings = 0
+
+    def add(self, chunk):
+        """
+        Add a cleaned ratings chunk (see `clean_ratings`).
+        """
+        if chunk.empty:
+            return
+
+        if self.keep_triplets:
+            self._user_ids.append(chunk['userId'].to_numpy(dtype=np.int32, copy=True))
+            self._movie_ids.append(chunk['movieId'].to_numpy(dtype=np.int32, copy=True))
+            self._ratings.append(chunk['rating'].to_numpy(dtype=np.float32, copy=True))
+        self.num_ratings += len(chunk)
+
+        grouped = chunk.groupby('movieId')['rating']
+        self._rating_count = self._rating_count.add(grouped.size(), fill_value=0)
+        self._rating_sum = self._rating_sum.add(grouped.sum().astype(np.float64), fill_value=0)
+
+    @property
+    def nbytes(self):
+        """
+        Bytes currently retained for the sparse matrix triplets.
+        """
+        return sum(a.nbytes for arrays in (self._user_ids, self._movie_ids, self._ratings) for a in arrays)
+
+    def popularity_stats(self):
+        """
+        Return a DataFrame with movieId, rating_count and rating_mean per movie.
+        """
+        count = self._rating_count.astype(np.int64)
+        stats = pd.DataFrame({
+            'movieId': count.index.astype(np.int64),
+            'rating_count': count.to_numpy(),
+            'rating_mean': (self._rating_sum / self._rating_count).to_numpy(),
+        })
+        return stats.sort_values('movieId', ignore_index=True)
+
+    def to_item_user_matrix(self):
+        """
+        Build the Item-User sparse matrix (Items as rows) from the collected triplets.
+
+        The stored triplets are released chunk by chunk while the matrix is
+        built, so the accumulator is empty afterwards.
+
+        Returns:
+            item_user_sparse_matrix (csr_matrix): Sparse matrix with shape (num_movies, num_users).
+            movie_ids (list): List of Movie IDs corresponding to the matrix rows.
+
+        Raises:
+            ValueError: If a user rated the same movie more than once, or the
+                accumulator was created with `keep_triplets=False`.
+        """
+        if not self.keep_triplets:
+            raise ValueError("RatingsAccumulator was created with keep_triplets=False; no matrix triplets were kept")
+
+        movie_ids = _union_ids(self._movie_ids)
+        user_ids = _union_ids(self._user_ids)
+
+        rows = np.empty(self.num_ratings, dtype=np.int32)
+        cols = np.empty(self.num_ratings, dtype=np.int32)
+        # float64 so the similarity model keeps the precision of the pivot path;
+        # half-point ratings are exact in the float32 triplets
+        data = np.empty(self.num_ratings, dtype=np.float64)
+
+        # Map raw ids to matrix positions one stored chunk at a time
+        offset = 0
+        while self._ratings:
+            chunk_movies = self._movie_ids.pop(0)
+            chunk_users = self._user_ids.pop(0)
+            chunk_ratings = self._ratings.pop(0)
+            end = offset + len(chunk_ratings)
+            rows[offset:end] = np.searchsorted(movie_ids, chunk_movies)
+            cols[offset:end] = np.searchsorted(user_ids, chunk_users)
+            data[offset:end] = chunk_ratings
+            offset = end
+
+        shape = (len(movie_ids), len(user_ids))
+        item_user_sparse_matrix = coo_matrix((data, (rows, cols)), shape=shape).tocsr()
+        del rows, cols, data
+
+        # tocsr() sums repeated (movie, user) pairs; refuse them like DataFrame.pivot does
+        num_ratings, self.num_ratings = self.num_ratings, 0
+        if item_user_sparse_matrix.nnz != num_ratings:
+            raise ValueError(f"Ratings contain {num_ratings - item_user_sparse_matrix.nnz} duplicate (userId, movieId) entries")
+        return item_user_sparse_matrix, movie_ids.tolist()
+
+def _union_ids(id_chunks):
+    unique_ids = np.empty(0, dtype=np.int32)
+    for ids in id_chunks:
+        unique_ids = np.union1d(unique_ids, np.unique(ids))
+    return unique_ids
+
+def stream_ratings(file_path, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Stream a ratings CSV in chunks, cleaning it on the fly, and build the
+    Item-User matrix and popularity stats without loading the whole file.
+
+    Returns:
+        item_user_sparse_matrix (csr_matrix): Sparse matrix with shape (num_movies, num_users).
+        movie_ids (list): List of Movie IDs corresponding to the matrix rows.
+        stats (DataFrame): movieId, rating_count and rating_mean per movie.
+    """
+    accumulator = RatingsAccumulator()
+    try:
+        for chunk in iter_rating_chunks(file_path, chunksize=chunksize):
+            accumulator.add(chunk)
+    except FileNotFoundError:
+        print(f"Error: The file at {file_path} was not found.")
+        return None, None, None
+
+    print(f"Data streamed successfully from {os.path.abspath(file_path)}. Total ratings: {accumulator.num_ratings}")
+
+    stats = accumulator.popularity_stats()
+    item_user_sparse_matrix, movie_ids = accumulator.to_item_user_matrix()
+
+    print(f"Item-User interaction matrix created with shape: {item_user_sparse_matrix.shape}")
+    return item_user_sparse_matrix, movie_ids, stats
     
 def create_user_item_matrix(ratings_df):
     """
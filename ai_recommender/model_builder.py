@@ -2,7 +2,7 @@ import numpy as np
 import pickle
 from sklearn.metrics.pairwise import cosine_similarity
 
-from data_loader import load_data, create_user_item_matrix
+from data_loader import stream_ratings
 
 similarity_model_path = "item_similarity_model.pkl"
 movie_id_mapping_path = "movie_id_mapping.pkl"
@@ -44,16 +44,10 @@ def build_and_save_model():
     """
     Build the item-based collaborative filtering model and save the assets.
     """
-    # Load data
-    ratings_df = load_data(rating_file_path)
-    if ratings_df is None:
-        print("Failed to load ratings data. Exiting.")
-        return
-
-    # Create item-user interaction matrix (Items are rows)
-    item_user_matrix, movie_ids = create_user_item_matrix(ratings_df)
+    # Stream the ratings in chunks straight into the item-user interaction matrix (Items are rows)
+    item_user_matrix, movie_ids, _ = stream_ratings(rating_file_path)
     if item_user_matrix is None:
-        print("Failed to create item-user matrix. Exiting.")
+        print("Failed to load ratings data. Exiting.")
         return
 
     # Compute item similarity matrix
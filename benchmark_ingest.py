@@ -0,0 +1,139 @@
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from ai_recommender.data_loader import BUILD_BYTES_PER_RATING, BYTES_PER_RATING, DEFAULT_CHUNKSIZE, stream_ratings
+
+# ml-25m scale: 25,000,095 ratings from 162,541 users on 59,047 movies
+NUM_RATINGS = 25_000_095
+NUM_USERS = 162_541
+NUM_MOVIES = 59_047
+
+# Generous per-row allowance for pandas parsing + cleaning a single chunk,
+# including the C tokenizer buffers that tracemalloc cannot see
+CHUNK_BYTES_PER_ROW = 64
+
+def write_synthetic_ratings(path, num_ratings, num_users, num_movies, chunksize, seed=42):
+    """
+    Write a MovieLens-shaped ratings CSV (userId,movieId,rating,timestamp) chunk by chunk.
+    Each chunk covers its own block of users, so (userId, movieId) pairs stay unique.
+    A small share of rows is out of range so the 0.5-5.0 filter has work to do.
+    """
+    rng = np.random.default_rng(seed)
+    # Skewed movie popularity, like real MovieLens dumps
+    movie_weights = 1.0 / np.arange(1, num_movies + 1) ** 0.8
+    movie_weights /= movie_weights.sum()
+
+    num_chunks = -(-num_ratings // chunksize)
+    chunk_ends = np.minimum(np.arange(num_chunks + 1) * chunksize, num_ratings)
+    user_blocks = chunk_ends * num_users // num_ratings
+
+    header = True
+    for i in range(num_chunks):
+        n = min(chunksize, num_ratings - i * chunksize)
+        pairs = pd.DataFrame(columns=['userId', 'movieId'], dtype=np.int64)
+        while len(pairs) < n:
+            sample = pd.DataFrame({
+                'userId': rng.integers(user_blocks[i], user_blocks[i + 1], size=n) + 1,
+                'movieId': rng.choice(num_movies, size=n, p=movie_weights) + 1,
+            })
+            pairs = pd.concat([pairs, sample], ignore_index=True).drop_duplicates(ignore_index=True)
+        chunk = pairs.iloc[:n].copy()
+
+        ratings = rng.integers(1, 11, size=n) / 2.0
+        ratings[rng.random(n) < 0.001] = 7.5
+        chunk['rating'] = ratings
+        chunk['timestamp'] = rng.integers(789_652_009, 1_574_327_703, size=n)
+        chunk.to_csv(path, mode='w' if header else 'a', header=header, index=False)
+        header = False
+
+def memory_budget(num_ratings, chunksize):
+    """
+    Upper bound on the memory `stream_ratings` adds on top of the interpreter:
+    the retained triplets, the row/column index and CSR copies built from them,
+    and one chunk in flight. It is checked against both the traced peak and the
+    peak RSS growth of the process doing the ingestion.
+    """
+    return (BYTES_PER_RATING + BUILD_BYTES_PER_RATING) * num_ratings + CHUNK_BYTES_PER_ROW * chunksize
+
+def _peak_rss():
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def _measure_stream_ratings(path, chunksize):
+    """
+    Run `stream_ratings` and report its time, traced peak and peak RSS growth.
+    Runs in a fresh process so writing the synthetic file does not inflate the RSS peak.
+    """
+    rss_before = _peak_rss()
+    tracemalloc.start()
+    start = time.perf_counter()
+    item_user_matrix, movie_ids, stats = stream_ratings(path, chunksize=chunksize)
+    elapsed = time.perf_counter() - start
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'nnz': item_user_matrix.nnz,
+        'num_movies': len(movie_ids),
+        'num_users': item_user_matrix.shape[1],
+        'stats_rows': len(stats),
+        'elapsed': elapsed,
+        'traced_peak': traced_peak,
+        'rss_peak': _peak_rss() - rss_before,
+    }
+
+def run_benchmark(num_ratings, num_users, num_movies, chunksize, keep_file=None):
+    path = keep_file or os.path.join(tempfile.mkdtemp(), "ratings.csv")
+    if not os.path.exists(path):
+        print(f"Writing {num_ratings:,} synthetic ratings to {path} ...")
+        start = time.perf_counter()
+        write_synthetic_ratings(path, num_ratings, num_users, num_movies, chunksize)
+        print(f"Synthetic data written in {time.perf_counter() - start:.1f}s "
+              f"({os.path.getsize(path) / 1e6:.0f} MB on disk)")
+
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        result = pool.apply(_measure_stream_ratings, (path, chunksize))
+
+    nnz = result['nnz']
+    budget = memory_budget(nnz, chunksize)
+    # What a plain pd.read_csv of the same file would hold (4 x 8-byte columns)
+    full_load = 32 * num_ratings
+
+    print("\n" + "="*40)
+    print(f"Ratings kept      : {nnz:,} ({result['num_movies']:,} movies x {result['num_users']:,} users)")
+    print(f"Stats rows        : {result['stats_rows']:,}")
+    print(f"Elapsed           : {result['elapsed']:.1f}s ({nnz / result['elapsed'] / 1e6:.2f}M ratings/s)")
+    print(f"Peak traced memory: {result['traced_peak'] / 1e6:.0f} MB")
+    print(f"Peak RSS growth   : {result['rss_peak'] / 1e6:.0f} MB")
+    print(f"Memory budget     : {budget / 1e6:.0f} MB")
+    print(f"Full read_csv     : ~{full_load / 1e6:.0f} MB before any pivot")
+    print("="*40)
+
+    if not keep_file:
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+    for label, peak in (("traced memory", result['traced_peak']), ("RSS growth", result['rss_peak'])):
+        if peak > budget:
+            raise SystemExit(f"Peak {label} {peak / 1e6:.0f} MB exceeded budget {budget / 1e6:.0f} MB")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark streaming ratings ingestion on synthetic ml-25m-sized data.")
+    parser.add_argument("--ratings", type=int, default=NUM_RATINGS)
+    parser.add_argument("--users", type=int, default=NUM_USERS)
+    parser.add_argument("--movies", type=int, default=NUM_MOVIES)
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--keep-file", help="Reuse (or create and keep) the synthetic CSV at this path")
+    args = parser.parse_args()
+
+    run_benchmark(args.ratings, args.users, args.movies, args.chunksize, args.keep_file)
@@ -5,6 +5,8 @@ from scipy.sparse import csr_matrix
 from sklearn.model_selection import train_test_split
 import os
 
+from ai_recommender.data_loader import load_data
+
 DATA_PATH = "movie-recommender/data/processed/ratings_clean.csv" 
 TOP_K = 10
 
@@ -36,7 +38,7 @@ def evaluate():
     else:
         path_to_use = DATA_PATH
 
-    ratings = pd.read_csv(path_to_use)
+    ratings = load_data(path_to_use)
     
     user_counts = ratings['userId'].value_counts()
     active_users = user_counts[user_counts >= 10].index
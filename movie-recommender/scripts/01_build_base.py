@@ -1,12 +1,20 @@
+import os
+import sys
 import pandas as pd
 import numpy as np
 import re
 
+# Share the ratings cleaning/stats code with the model pipeline
+root_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from ai_recommender.data_loader import DEFAULT_CHUNKSIZE, RatingsAccumulator, iter_rating_chunks
+
 RAW = "data/raw/ml-latest-small"
 OUT = "data/processed"
 
 movies  = pd.read_csv(f"{RAW}/movies.csv")      # movieId,title,genres
-ratings = pd.read_csv(f"{RAW}/ratings.csv")     # userId,movieId,rating,timestamp
 links   = pd.read_csv(f"{RAW}/links.csv")       # movieId,imdbId,tmdbId
 
 # ---- Clean movies ----
@@ -17,20 +25,19 @@ def extract_year(title):
 movies["year"] = movies["title"].apply(extract_year)
 movies["title_clean"] = movies["title"].str.replace(r"\s*\(\d{4}\)\s*$", "", regex=True)
 
-# ---- Clean ratings ----
-ratings = ratings.dropna(subset=["userId","movieId","rating"])
-ratings["userId"] = ratings["userId"].astype(int)
-ratings["movieId"] = ratings["movieId"].astype(int)
-ratings["rating"] = ratings["rating"].astype(float)
+# ---- Clean ratings + popularity stats for UI (streamed) ----
+# Each chunk is cleaned (0.5–5.0 filter) and written to ratings_clean.csv as
+# soon as it is read; the accumulator keeps only per-movie counts/sums, so the
+# full ratings table is never in memory.
+stats_acc = RatingsAccumulator(keep_triplets=False)
 
-# Optional: remove impossible ratings (MovieLens is typically 0.5–5.0)
-ratings = ratings[(ratings["rating"] >= 0.5) & (ratings["rating"] <= 5.0)]
+header = True
+for chunk in iter_rating_chunks(f"{RAW}/ratings.csv", chunksize=DEFAULT_CHUNKSIZE, usecols=None):   # userId,movieId,rating,timestamp
+    chunk.to_csv(f"{OUT}/ratings_clean.csv", mode="w" if header else "a", header=header, index=False)
+    header = False
+    stats_acc.add(chunk)
 
-# ---- Popularity stats for UI ----
-stats = (ratings.groupby("movieId")
-         .agg(rating_count=("rating","size"),
-              rating_mean=("rating","mean"))
-         .reset_index())
+stats = stats_acc.popularity_stats()
 
 # ---- Merge movies + stats + links ----
 base = (movies.merge(stats, on="movieId", how="left")
@@ -41,6 +48,5 @@ base["rating_mean"]  = base["rating_mean"].fillna(0).round(3)
 
 # Save outputs
 base.to_csv(f"{OUT}/movies_base.csv", index=False)
-ratings.to_csv(f"{OUT}/ratings_clean.csv", index=False)
 
 print("Saved:", f"{OUT}/movies_base.csv", "and", f"{OUT}/ratings_clean.csv")